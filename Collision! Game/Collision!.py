@@ -42,6 +42,84 @@ ORANGE = (204, 102, 0)
 GREY = (211, 211, 211)
 font = pygame.font.Font(None, 36)
 
+# Quality levels used by the frame governor, from full quality (0) down to the cheapest (3)
+# Enemies are always drawn at every level, only how they are drawn changes
+QUALITY_LEVELS = [
+    {'name': 'High', 'rotation_step': 1, 'rotate_enemies': True, 'hud_interval': 1},
+    {'name': 'Medium', 'rotation_step': 15, 'rotate_enemies': True, 'hud_interval': 5},
+    {'name': 'Low', 'rotation_step': 30, 'rotate_enemies': True, 'hud_interval': 10},
+    {'name': 'Minimal', 'rotation_step': 45, 'rotate_enemies': False, 'hud_interval': 25}
+]
+
+class FrameGovernor:
+    def __init__(self, target_fps=50, window=25):
+        self.target_fps = target_fps
+        self.frame_budget = 1000 / target_fps  # Milliseconds available per frame
+        self.window = window  # Number of frames averaged before deciding to change level
+        self.frame_times = []
+        self.level = 0
+        self.calm_windows = 0  # Consecutive windows with plenty of spare time
+        self.frame_count = 0
+        self.skip_sample = True  # The first tick of a clock measures the gap since it was created
+
+    @property
+    def quality(self):
+        return QUALITY_LEVELS[self.level]
+
+    def reset(self):
+        # Call when a loop starts or resumes after time spent elsewhere (another screen, game over).
+        # The level itself is kept on purpose: it reflects what this machine can handle, so a new
+        # game starts at whatever level the governor has reached rather than back at High
+        self.frame_times = []
+        self.calm_windows = 0
+        self.skip_sample = True
+
+    def tick(self, clock):
+        # Replaces clock.tick(); get_rawtime() is the work done last frame, excluding the wait
+        clock.tick(self.target_fps)
+        self.frame_count += 1
+        if self.skip_sample:
+            # This sample covers the time away from the loop, not a real frame
+            self.skip_sample = False
+            return
+        self.frame_times.append(clock.get_rawtime())
+        if len(self.frame_times) < self.window:
+            return
+        average = sum(self.frame_times) / len(self.frame_times)
+        self.frame_times = []
+        if average > self.frame_budget * 0.9 and self.level < len(QUALITY_LEVELS) - 1:
+            # Falling behind, drop a quality level straight away
+            self.level += 1
+            self.calm_windows = 0
+        elif average < self.frame_budget * 0.5 and self.level > 0:
+            # Only step back up after several calm windows so the level doesn't flicker
+            self.calm_windows += 1
+            if self.calm_windows >= 4:
+                self.level -= 1
+                self.calm_windows = 0
+        else:
+            self.calm_windows = 0
+
+    def snap_angle(self, angle):
+        # Round an angle to the current rotation step so fewer distinct rotations are needed
+        step = self.quality['rotation_step']
+        return int(angle // step * step) % 360
+
+    def refresh_hud(self):
+        return self.frame_count % self.quality['hud_interval'] == 0
+
+    def report(self):
+        return f"Quality: {self.quality['name']} ({self.level})"
+
+governor = FrameGovernor()
+rotation_cache = {}  # source surface -> {angle: rotated surface}, shared between objects using the same sprite
+
+def rotate_cached(image, angle):
+    rotations = rotation_cache.setdefault(image, {})
+    if angle not in rotations:
+        rotations[angle] = pygame.transform.rotate(image, angle)
+    return rotations[angle]
+
 class Player:
     def __init__(self):
         self.x = WIDTH // 2
@@ -221,8 +299,12 @@ class AIObject:
                 spawned_at_least_10 = True
             
     def draw(self):
-        # Rotate the image
-        rotated_image = pygame.transform.rotate(self.orig_image, self.angle)
+        # At the lowest quality level enemies are drawn without rotating
+        if not governor.quality['rotate_enemies']:
+            screen.blit(self.orig_image, self.rect)
+            return
+        # Rotate the image, using the governor's rotation step so rotations can be reused
+        rotated_image = rotate_cached(self.orig_image, governor.snap_angle(self.angle))
         # Get a new rect with the center of the original rect
         new_rect = rotated_image.get_rect(center=self.rect.center)
         # Draw the rotated image
@@ -277,7 +359,7 @@ class MovingObject:
         if self.is_active:
             # Fixed rotation speed
             self.angle = (self.angle + self.rotation_speed) % 360
-            self.image = pygame.transform.rotate(self.original_image, self.angle).convert_alpha()
+            self.image = rotate_cached(self.original_image, governor.snap_angle(self.angle))
             self.rect = self.image.get_rect(center=self.rect.center)
 
 GAME_SETTINGS = {
@@ -340,8 +422,11 @@ def game_loop(difficulty='easy'):
     last_time = pygame.time.get_ticks()  # Handles the player growth timer
     start_timer = pygame.time.get_ticks()  # This is used for accumulating brace mechanic charges
     clock = pygame.time.Clock()  # Used for FPS
+    governor.reset()
     elapsed_time = pygame.time.get_ticks()  # Used for scoring
     start_time = pygame.time.get_ticks()  # Used together with elapsed_time for scoring
+    hud_font = pygame.font.Font(None, 36)
+    hud_surfaces = []  # Rendered HUD text, only re-rendered as often as the governor allows
 
     while running:
         current_time = pygame.time.get_ticks()
@@ -402,6 +487,7 @@ def game_loop(difficulty='easy'):
                     brace_charges = 0
                     start_timer = pygame.time.get_ticks()
                     last_spawn_time = current_time - random.randint(0, 1000) # Restart AI object spawn delay              
+                    governor.reset()  # Don't count the time spent on the game over screen as a frame
                     continue
             continue  # Skip the rest of the loop to avoid processing game logic
 
@@ -513,16 +599,19 @@ def game_loop(difficulty='easy'):
 
         keyp = pygame.key.get_pressed()
         if keyp[pygame.K_b]:
-            # Render score, current charges and time elapsed during an active game
-            font = pygame.font.Font(None, 36)
-            score_text = font.render(f"Score: {score}", True, WHITE)
-            screen.blit(score_text, (10, 10))
-            time_text = font.render(f"Time elapsed: {display_time(elapsed_time)}", True, WHITE)
-            screen.blit(time_text, (565, 10))
-            brace_text = font.render(f"Charges: {brace_charges}", True, WHITE)
-            screen.blit(brace_text, (10, 35))
+            # Render score, current charges, time elapsed and quality level during an active game
+            if not hud_surfaces or governor.refresh_hud():
+                score_text = hud_font.render(f"Score: {score}", True, WHITE)
+                time_text = hud_font.render(f"Time elapsed: {display_time(elapsed_time)}", True, WHITE)
+                brace_text = hud_font.render(f"Charges: {brace_charges}", True, WHITE)
+                quality_text = hud_font.render(governor.report(), True, WHITE)
+                hud_surfaces = [(score_text, (10, 10)), (time_text, (565, 10)), (brace_text, (10, 35)), (quality_text, (10, 60))]
+            for text, position in hud_surfaces:
+                screen.blit(text, position)
+        else:
+            hud_surfaces = []
         pygame.display.flip()
-        clock.tick(50)  # 50 FPS for smooth movement
+        governor.tick(clock)  # 50 FPS for smooth movement, lowering quality if frames run long
 
     pygame.quit()
     sys.exit()
@@ -574,6 +663,7 @@ def show_menu():
     logo_rect = logo.get_rect(center=(WIDTH // 2, 150))  # Position the logo in the center top
     
     clock = pygame.time.Clock()
+    governor.reset()
     
     # Initialize the moving object
     moving_object = MovingObject('Images/animation.png')
@@ -596,11 +686,14 @@ def show_menu():
                     if options[current_selection] == "Easy Mode":
                         current_difficulty = 'easy'
                         game_loop(current_difficulty)
+                        governor.reset()  # Back in the menu after time spent on another screen
                     elif options[current_selection] == "Hard Mode":
                         current_difficulty = 'hard'
                         game_loop(current_difficulty)
+                        governor.reset()
                     elif options[current_selection] == "How to Play":
                         show_how_to_play()
+                        governor.reset()
                     elif options[current_selection] == "Quit":
                         pygame.quit()
                         sys.exit()
@@ -637,7 +730,7 @@ def show_menu():
             screen.blit(moving_object.image, moving_object.rect)
         
         pygame.display.flip()
-        clock.tick(50)
+        governor.tick(clock)
         
 if __name__ == "__main__":
     show_menu()